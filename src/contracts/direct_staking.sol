@@ -49,6 +49,7 @@ contract DirectStaking is Initializable, PausableUpgradeable, AccessControlUpgra
 
     uint256 private constant DEPOSIT_AMOUNT_UNIT = 1000000000 wei;
     uint256 private constant SIGNATURE_LENGTH = 96;
+    uint256 private constant PACKED_RECORD_LENGTH = 101; // pubkey(48) + claimAddr(20) + extraData(32) + exiting(1)
     address public constant ethDepositContract = 0x00000000219ab540356cBB839Cbe05303d7705Fa;
 
     /**
@@ -248,6 +249,37 @@ contract DirectStaking is Initializable, PausableUpgradeable, AccessControlUpgra
         }
     }
 
+    /**
+     * @dev return registered validator by range, tightly packed as fixed-width records:
+     *  pubkey(48 bytes) | claimAddr(20 bytes) | extraData(32 bytes, big endian) | exiting(1 byte)
+     */
+    function getValidatorInfosPacked(uint256 from, uint256 to) external view returns (bytes memory packed) {
+        packed = new bytes((to - from) * PACKED_RECORD_LENGTH);
+
+        uint256 offset = 0;
+        for (uint i = from; i < to;i++) {
+            ValidatorInfo storage info = validatorRegistry[i];
+            bytes memory pubkey = info.pubkey;
+            address claimAddr = info.claimAddr;
+            uint256 extraData = info.extraData;
+            bool exiting = info.exiting;
+            _require(pubkey.length == 48, "PUBKEY_LENGTH");
+
+            // each field is written with a full word, the tail of which is overwritten
+            // by the next field, so no write exceeds the record.
+            assembly {
+                let ptr := add(add(packed, 32), offset)
+                mstore(ptr, mload(add(pubkey, 32)))
+                mstore(add(ptr, 32), mload(add(pubkey, 64)))
+                mstore(add(ptr, 48), shl(96, claimAddr))
+                mstore(add(ptr, 68), extraData)
+                mstore8(add(ptr, 100), exiting)
+            }
+
+            offset += PACKED_RECORD_LENGTH;
+        }
+    }
+
     /**
      * @dev return validators count
      */
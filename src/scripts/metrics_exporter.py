@@ -0,0 +1,113 @@
+"""
+Prometheus exporter for direct staking & reward pool state.
+
+usage:
+    METRICS_PORT=9100 POLL_INTERVAL=12 brownie run metrics_exporter --network mainnet
+
+contract views and the reward pool balance are read once per new block, pinned to that
+block and batched into a single Multicall2 call; scrapes are served from the gauges and
+never touch the node.
+
+requires prometheus_client.
+"""
+from brownie import *
+from brownie import multicall
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, start_http_server
+
+import os
+import time
+
+# mainnet deploy, override with DIRECT_STAKING / REWARDPOOL / MULTICALL2 env
+DIRECT_STAKING = "0xe8239B17034c372CDF8A5F8d3cCb7Cf1795c4572"
+REWARDPOOL = "0xb7019c9184580b2E1f66fCDc3EB6c62621732064"
+MULTICALL2 = "0x5BA1e12693Dc8F9c48aAD8770482f4739bEeD696"
+
+MULTICALL2_ABI = [{
+    "inputs": [{"internalType": "address", "name": "addr", "type": "address"}],
+    "name": "getEthBalance",
+    "outputs": [{"internalType": "uint256", "name": "balance", "type": "uint256"}],
+    "stateMutability": "view",
+    "type": "function",
+}]
+
+class StakingMetricsExporter:
+    def __init__(self, direct_staking, rewardpool, multicall2, registry=None):
+        self.direct_staking = direct_staking
+        self.rewardpool = rewardpool
+        self.multicall2 = multicall2
+        self.registry = registry if registry is not None else CollectorRegistry()
+        self.last_block = None
+
+        def gauge(name, doc):
+            return Gauge(name, doc, registry=self.registry)
+
+        self.block_number = gauge('directstaking_exporter_block_number', 'block height of the last sampled state')
+        self.validators = gauge('directstaking_validators', 'registered validators, getNextValidators()')
+        self.exit_queue_length = gauge('directstaking_exit_queue_length', 'validators in exit queue, getExitQueueLength()')
+        self.direct_staking_paused = gauge('directstaking_paused', '1 if direct staking contract is paused')
+
+        self.total_share = gauge('rewardpool_total_share', 'total shares in reward pool, getTotalShare()')
+        self.accounted_balance = gauge('rewardpool_accounted_balance_wei', 'accounted balance, getAccountedBalance()')
+        self.balance = gauge('rewardpool_balance_wei', 'actual ether balance of reward pool')
+        self.unaccounted_balance = gauge('rewardpool_unaccounted_balance_wei', 'balance waiting for updateReward()')
+        self.pending_manager_revenue = gauge('rewardpool_pending_manager_revenue_wei', 'getPendingManagerRevenue()')
+        self.rewardpool_paused = gauge('rewardpool_paused', '1 if reward pool contract is paused')
+
+        self.rpc_latency = Histogram('directstaking_exporter_rpc_latency_seconds', 'latency of rpc requests issued by exporter',
+                ['call'], registry=self.registry)
+        self.poll_errors = Counter('directstaking_exporter_poll_errors', 'failed polls', registry=self.registry)
+
+    def poll(self):
+        """
+        sample contract state if a new block arrived, returns True if gauges were updated
+        """
+        with self.rpc_latency.labels('eth_blockNumber').time():
+            height = web3.eth.block_number
+
+        if height == self.last_block:
+            return False
+
+        with self.rpc_latency.labels('multicall').time():
+            with multicall(address=self.multicall2.address, block_identifier=height):
+                balance = self.multicall2.getEthBalance(self.rewardpool.address)
+                validators = self.direct_staking.getNextValidators()
+                exit_queue_length = self.direct_staking.getExitQueueLength()
+                direct_staking_paused = self.direct_staking.paused()
+                total_share = self.rewardpool.getTotalShare()
+                accounted_balance = self.rewardpool.getAccountedBalance()
+                pending_manager_revenue = self.rewardpool.getPendingManagerRevenue()
+                rewardpool_paused = self.rewardpool.paused()
+
+        self.validators.set(validators)
+        self.exit_queue_length.set(exit_queue_length)
+        self.direct_staking_paused.set(1 if direct_staking_paused else 0)
+        self.total_share.set(total_share)
+        self.accounted_balance.set(accounted_balance)
+        self.balance.set(balance)
+        self.unaccounted_balance.set(max(balance - accounted_balance, 0))
+        self.pending_manager_revenue.set(pending_manager_revenue)
+        self.rewardpool_paused.set(1 if rewardpool_paused else 0)
+
+        self.block_number.set(height)
+        self.last_block = height
+        return True
+
+    def run(self, port, interval):
+        start_http_server(port, registry=self.registry)
+        print(f'serving metrics on :{port}, polling every {interval}s')
+
+        while True:
+            try:
+                self.poll()
+            except Exception as e:
+                self.poll_errors.inc()
+                print("poll failed:", e)
+            time.sleep(interval)
+
+def main():
+    direct_staking = Contract.from_abi("DirectStaking", os.getenv('DIRECT_STAKING', DIRECT_STAKING), DirectStaking.abi)
+    rewardpool = Contract.from_abi("RewardPool", os.getenv('REWARDPOOL', REWARDPOOL), RewardPool.abi)
+    multicall2 = Contract.from_abi("Multicall2", os.getenv('MULTICALL2', MULTICALL2), MULTICALL2_ABI)
+
+    exporter = StakingMetricsExporter(direct_staking, rewardpool, multicall2)
+    exporter.run(int(os.getenv('METRICS_PORT', '9100')), float(os.getenv('POLL_INTERVAL', '12')))
@@ -0,0 +1,110 @@
+"""
+Decoder & bulk dump for DirectStaking.getValidatorInfosPacked().
+
+usage:
+    CHUNK_SIZE=1000 ABI_CHUNK_SIZE=100 OUTPUT=validators.bin brownie run validator_registry --network mainnet
+
+getValidatorInfosPacked() only exists once the DirectStaking proxy is upgraded to an
+implementation that has it; until then point DIRECT_STAKING at such a deployment.
+ABI_CHUNK_SIZE is the range per getValidatorInfos() call in the comparison, kept smaller
+since the ABI encoded view hits eth_call limits sooner.
+
+records are fixed-width, so the returned blob is viewed in place as a numpy structured
+array (or sliced through memoryview), no per-record objects are allocated.
+
+requires numpy.
+"""
+from brownie import *
+
+import os
+import time
+import numpy
+
+# mainnet deploy, override with DIRECT_STAKING env
+DIRECT_STAKING = "0xe8239B17034c372CDF8A5F8d3cCb7Cf1795c4572"
+
+RECORD_DTYPE = numpy.dtype([
+    ('pubkey', 'u1', (48,)),
+    ('claimAddr', 'u1', (20,)),
+    ('extraData', 'u1', (32,)),     # big endian uint256
+    ('exiting', '?'),
+])
+RECORD_LENGTH = RECORD_DTYPE.itemsize
+
+def decode(packed):
+    """
+    view packed records as a numpy structured array, sharing memory with `packed`
+    """
+    if len(packed) % RECORD_LENGTH != 0:
+        raise ValueError(f'packed length {len(packed)} is not a multiple of {RECORD_LENGTH}')
+    return numpy.frombuffer(packed, dtype=RECORD_DTYPE)
+
+def record(packed, idx):
+    """
+    return (pubkey, claimAddr, extraData, exiting) of the idx-th record, fields as memoryview slices
+    """
+    mv = memoryview(packed)[idx * RECORD_LENGTH:(idx + 1) * RECORD_LENGTH]
+    return mv[0:48], mv[48:68], mv[68:100], mv[100] != 0
+
+def dump(direct_staking, out, chunk_size, block_identifier=None):
+    """
+    write the full registry to `out` in packed format, returns records dumped
+    """
+    if block_identifier is None:
+        block_identifier = web3.eth.block_number
+    total = direct_staking.getNextValidators(block_identifier=block_identifier)
+
+    for start in range(0, total, chunk_size):
+        end = min(start + chunk_size, total)
+        out.write(direct_staking.getValidatorInfosPacked(start, end, block_identifier=block_identifier))
+
+    return total
+
+def _records_per_sec(call, total, chunk_size):
+    begin = time.perf_counter()
+    for start in range(0, total, chunk_size):
+        call(start, min(start + chunk_size, total))
+    return total / (time.perf_counter() - begin)
+
+def benchmark(direct_staking, chunk_size, abi_chunk_size, block_identifier):
+    """
+    records/sec of getValidatorInfos() and getValidatorInfosPacked() over the full registry,
+    a view failing (e.g. hitting eth_call gas or size limits) is reported as its exception
+    """
+    total = direct_staking.getNextValidators(block_identifier=block_identifier)
+    views = {
+        'getValidatorInfos': (abi_chunk_size,
+            lambda start, end: direct_staking.getValidatorInfos(start, end, block_identifier=block_identifier)),
+        'getValidatorInfosPacked': (chunk_size,
+            lambda start, end: decode(direct_staking.getValidatorInfosPacked(start, end, block_identifier=block_identifier))),
+    }
+
+    result = {}
+    for view, (size, call) in views.items():
+        try:
+            result[view] = _records_per_sec(call, total, size)
+        except Exception as e:
+            result[view] = e
+    return result
+
+def main():
+    direct_staking = Contract.from_abi("DirectStaking", os.getenv('DIRECT_STAKING', DIRECT_STAKING), DirectStaking.abi)
+    chunk_size = int(os.getenv('CHUNK_SIZE', '1000'))
+    abi_chunk_size = int(os.getenv('ABI_CHUNK_SIZE', '100'))
+    output = os.getenv('OUTPUT', 'validators.bin')
+    height = web3.eth.block_number
+
+    begin = time.perf_counter()
+    with open(output, 'wb') as f:
+        total = dump(direct_staking, f, chunk_size, height)
+    elapsed = time.perf_counter() - begin
+    print(f'dumped {total} validators at block {height} to {output} in {elapsed:.2f}s')
+
+    if total == 0:
+        return
+
+    for view, rate in benchmark(direct_staking, chunk_size, abi_chunk_size, height).items():
+        if isinstance(rate, Exception):
+            print(f'{view}: failed, {rate}')
+        else:
+            print(f'{view}: {rate:.0f} records/sec')
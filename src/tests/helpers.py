@@ -0,0 +1,19 @@
+""" shared helpers for tests """
+import eth_abi
+import hashlib
+
+from brownie import convert
+from brownie.network.state import Chain
+
+def digest(extraData, contractAddr, claimaddr, withdrawaddr, pubkeys, signatures):
+    abi = eth_abi.encode(['uint256','address', 'uint256', 'address', 'address'], [extraData, contractAddr, Chain().id, claimaddr, convert.to_address(withdrawaddr)])
+    digest = hashlib.sha256(abi)
+
+    for i in range(len(pubkeys)):
+        pubkey = pubkeys[i]
+        signature = signatures[i]
+        abi = eth_abi.encode(['bytes32', 'bytes', 'bytes'], [convert.to_bytes(digest.hexdigest(),"bytes32"), convert.to_bytes(pubkey,"bytes"), convert.to_bytes(signature,"bytes")])
+        digest = hashlib.sha256(abi)
+
+    return digest
+
@@ -14,6 +14,7 @@ from brownie.network.state import Chain
 from eth_account.messages import encode_defunct
 from eth_account import Account
 from pathlib import Path
+from tests.helpers import digest
 
 """ test of emergency exit a validator"""
 def test_emergencyExit(setup_contracts, owner, pubkeys, sigs, signerPrivate, withdraw_address):
@@ -111,17 +112,3 @@ def test_batchEmergencyExit(setup_contracts, owner, pubkeys, sigs, signerPrivate
     ''' emergencyExit again should revert '''
     with brownie.reverts("EXITING"):
         transparent_ds.emergencyExit(1, False, {'from':owner})
-   
-def digest(extraData, contractAddr, claimaddr, withdrawaddr, pubkeys, signatures):
-    #print(EthAddress(claimaddr))
-    abi = eth_abi.encode(['uint256','address', 'uint256', 'address', 'address'], [extraData, contractAddr, Chain().id, claimaddr, convert.to_address(withdrawaddr)])
-    digest = hashlib.sha256(abi)
-
-    for i in range(len(pubkeys)):
-        pubkey = pubkeys[i]
-        signature = signatures[i]
-        abi = eth_abi.encode(['bytes32', 'bytes', 'bytes'], [convert.to_bytes(digest.hexdigest(),"bytes32"), convert.to_bytes(pubkey,"bytes"), convert.to_bytes(signature,"bytes")])
-        digest = hashlib.sha256(abi)
-
-    return digest
-
@@ -0,0 +1,64 @@
+import pytest
+import brownie
+
+from brownie import *
+from brownie import multicall
+from brownie._config import CONFIG
+from eth_account.messages import encode_defunct
+from eth_account import Account
+
+from scripts.metrics_exporter import StakingMetricsExporter
+from tests.helpers import digest
+
+# Multicall2 on local chain, must exist before the block pinned by poll().
+# multicall.deploy records its address in the active network config, which outlives
+# the contract once the next setup_contracts resets the chain, so drop it on teardown.
+@pytest.fixture
+def multicall2(setup_contracts, owner):
+    yield multicall.deploy({'from': owner})
+    CONFIG.active_network.pop("multicall2", None)
+
+""" test of metrics exporter sampling against local chain """
+def test_metricsExporter(setup_contracts, multicall2, owner, pubkeys, sigs, signerPrivate, withdraw_address):
+    transparent_ds, transparent_rewardpool = setup_contracts
+    claimAddr = owner.address
+
+    exporter = StakingMetricsExporter(transparent_ds, transparent_rewardpool, multicall2)
+    sample = exporter.registry.get_sample_value
+
+    ''' empty contracts '''
+    assert exporter.poll()
+    assert sample('directstaking_validators') == 0
+    assert sample('rewardpool_total_share') == 0
+    assert sample('directstaking_paused') == 0
+
+    ''' sign digest in EIP-191 standard '''
+    md = digest(0, transparent_ds.address, claimAddr, withdraw_address, pubkeys, sigs)
+    message = encode_defunct(md.digest())
+    signed_message = Account.sign_message(message, private_key=signerPrivate)
+    transparent_ds.stake(claimAddr, withdraw_address, pubkeys, sigs, bytes(signed_message.signature), 0, 0, {"from":owner, 'value': '64 ether'})
+
+    ''' Transfer 0.1 eth as MEV revenue '''
+    owner.transfer(transparent_rewardpool.address, '0.1 ethers')
+    transparent_ds.emergencyExit(0, False, {'from':owner})
+    transparent_ds.pause({'from':owner})
+
+    assert exporter.poll()
+    assert sample('directstaking_exporter_block_number') == web3.eth.block_number
+    assert sample('directstaking_validators') == 2
+    assert sample('directstaking_exit_queue_length') == 1
+    assert sample('directstaking_paused') == 1
+    assert sample('rewardpool_paused') == 0
+    assert sample('rewardpool_total_share') == transparent_rewardpool.getTotalShare()
+    assert sample('rewardpool_balance_wei') == transparent_rewardpool.balance()
+    assert sample('rewardpool_accounted_balance_wei') == transparent_rewardpool.getAccountedBalance()
+    assert sample('rewardpool_pending_manager_revenue_wei') == transparent_rewardpool.getPendingManagerRevenue()
+
+    ''' MEV waiting for updateReward '''
+    owner.transfer(transparent_rewardpool.address, '0.1 ethers')
+    assert exporter.poll()
+    assert sample('rewardpool_unaccounted_balance_wei') == Wei('0.1 ether')
+
+    ''' no new block, served from cache '''
+    assert not exporter.poll()
+    assert sample('directstaking_exporter_rpc_latency_seconds_count', {'call': 'multicall'}) == 3
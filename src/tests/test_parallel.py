@@ -0,0 +1,22 @@
+import os
+import pytest
+
+from urllib.parse import urlparse
+from brownie import *
+from brownie.network import rpc
+from brownie._config import CONFIG, _get_data_folder, _load_config
+
+""" test of each xdist worker running against its own local chain """
+def test_workerChainIsolation():
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if worker is None:
+        pytest.skip("not running under xdist")
+
+    ''' configured port, before brownie's per-worker offset '''
+    networks = _load_config(_get_data_folder().joinpath("network-config.yaml"))
+    network = next(n for n in networks["development"] if n["id"] == CONFIG.active_network["id"])
+    base_port = network["cmd_settings"]["port"]
+
+    ''' connected to a chain launched by this worker, on port + worker index '''
+    assert rpc.is_child()
+    assert urlparse(web3.provider.endpoint_uri).port == base_port + int(worker.lstrip("gw"))
@@ -0,0 +1,46 @@
+import pytest
+import brownie
+
+from brownie import *
+from brownie import convert
+from eth_account.messages import encode_defunct
+from eth_account import Account
+
+from tests.helpers import digest
+
+numpy = pytest.importorskip("numpy")
+from scripts.validator_registry import decode, record, RECORD_LENGTH
+
+""" test of packed validator registry view """
+def test_getValidatorInfosPacked(setup_contracts, owner, pubkeys, sigs, signerPrivate, withdraw_address):
+    transparent_ds, transparent_rewardpool = setup_contracts
+    claimAddr = owner.address
+
+    ''' sign digest in EIP-191 standard '''
+    md = digest(7, transparent_ds.address, claimAddr, withdraw_address, pubkeys, sigs)
+    message = encode_defunct(md.digest())
+    signed_message = Account.sign_message(message, private_key=signerPrivate)
+    transparent_ds.stake(claimAddr, withdraw_address, pubkeys, sigs, bytes(signed_message.signature), 7, 0, {"from":owner, 'value': '64 ether'})
+    transparent_ds.emergencyExit(1, False, {'from':owner})
+
+    packed = transparent_ds.getValidatorInfosPacked(0, 2)
+    records = decode(packed)
+    assert len(packed) == 2 * RECORD_LENGTH
+    assert len(records) == 2
+
+    ''' packed records match abi encoded view '''
+    (pubkeysOut, claimAddresses, extraDatas) = transparent_ds.getValidatorInfos(0, 2)
+    for i in range(2):
+        pubkey, claim, extraData, exiting = record(packed, i)
+        assert bytes(pubkey) == convert.to_bytes(pubkeysOut[i], "bytes") == records[i]['pubkey'].tobytes()
+        assert convert.to_address(bytes(claim)) == claimAddresses[i] == claimAddr
+        assert int.from_bytes(extraData, 'big') == extraDatas[i] == 7
+        assert exiting == bool(records[i]['exiting']) == (i == 1)
+
+    ''' partial and empty range '''
+    assert bytes(transparent_ds.getValidatorInfosPacked(1, 2)) == bytes(packed)[RECORD_LENGTH:]
+    assert len(transparent_ds.getValidatorInfosPacked(2, 2)) == 0
+
+    ''' out of range should revert '''
+    with brownie.reverts():
+        transparent_ds.getValidatorInfosPacked(0, 3)
@@ -0,0 +1,71 @@
+"""
+Measure test suite speedup of `brownie test -n <workers>` as worker count grows.
+
+plain python tool, do not invoke with `brownie run`:
+    cd src
+    python tools/parallel_speedup.py [--network <network>]
+
+network defaults to mainnet-fork, the tests need chain id 1 or 5.
+exits non-zero if any run fails; a failing serial run stops before any timing is compared.
+
+each run writes a merged junit report to reports/junit-<workers>.xml.
+"""
+from pathlib import Path
+
+import os
+import subprocess
+import sys
+import time
+
+DEFAULT_NETWORK = "mainnet-fork"
+
+def worker_counts():
+    cpus = os.cpu_count() or 1
+    counts = []
+    n = 1
+    while n < cpus:
+        counts.append(n)
+        n *= 2
+    if cpus not in counts:
+        counts.append(cpus)
+    return counts
+
+def run_suite(workers, extra_args):
+    project_root = Path(__file__).resolve().parent.parent
+    report = project_root / "reports" / f"junit-{workers}.xml"
+    report.parent.mkdir(exist_ok=True)
+
+    cmd = ["brownie", "test", f"--junitxml={report}", *extra_args]
+    if workers > 1:
+        cmd += ["-n", str(workers)]
+
+    begin = time.perf_counter()
+    result = subprocess.run(cmd, cwd=project_root)
+    return time.perf_counter() - begin, result.returncode
+
+def main(extra_args=()):
+    extra_args = list(extra_args)
+    if not any(arg == "--network" or arg.startswith("--network=") for arg in extra_args):
+        extra_args += ["--network", DEFAULT_NETWORK]
+
+    counts = worker_counts()
+    baseline, returncode = run_suite(counts[0], extra_args)
+    if returncode != 0:
+        print(f'serial run failed with exit code {returncode}, no speedup to report')
+        sys.exit(1)
+
+    results = [(counts[0], baseline, returncode)]
+    results += [(workers, *run_suite(workers, extra_args)) for workers in counts[1:]]
+
+    print(f'{"workers":>8} {"seconds":>10} {"speedup":>8} {"status":>7}')
+    for workers, elapsed, returncode in results:
+        if returncode == 0:
+            print(f'{workers:>8} {elapsed:>10.2f} {baseline / elapsed:>7.2f}x {"ok":>7}')
+        else:
+            print(f'{workers:>8} {elapsed:>10.2f} {"-":>8} {"failed":>7}')
+
+    if any(returncode != 0 for _, _, returncode in results):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])